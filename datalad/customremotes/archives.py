@@ -405,8 +405,8 @@ class ArchiveAnnexCustomRemote(AnnexCustomRemote):
                 # so
                 pwd = getpwd()
                 lgr.debug(
-                    "Getting file {afile} from {akey_path} "
-                    "while PWD={pwd}".format(**locals()))
+                    "Getting file %s from %s while PWD=%s",
+                    afile, akey_path, pwd)
                 was_extracted = self.cache[akey_path].is_extracted
                 apath = self.cache[akey_path].get_extracted_file(afile)
                 link_file_load(apath, file)
@@ -434,7 +434,7 @@ class ArchiveAnnexCustomRemote(AnnexCustomRemote):
 
         raise RemoteError(
             "Failed to fetch any archive containing {key}. "
-            "Tried: {akeys_tried}".format(**locals())
+            "Tried: {akeys_tried}".format(key=key, akeys_tried=akeys_tried)
         )
 
     def claimurl(self, url):
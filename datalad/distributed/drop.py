@@ -683,7 +683,11 @@ def _detect_nondead_annex_at_remotes(repo, annex_uuid):
         try:
             for line in repo.call_git_items_(
                     ['cat-file', '-p', refprefix + 'trust.log']):
-                columns = line.split()
+                # cheap prefix test to avoid splitting every line,
+                # and only the first two columns are needed
+                if not line.startswith(annex_uuid):
+                    continue
+                columns = line.split(None, 2)
                 if columns[0] == annex_uuid:
                     # not known if dead
                     uuid_known = False if columns[1] == 'X' else True
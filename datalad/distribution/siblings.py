@@ -548,7 +548,7 @@ def _configure_remote(
                 lgr.info(
                     'Configure additional default publication refspec "%s"',
                     refspec)
-                ds.config.add(dfltvar, refspec, 'local')
+                ds.config.add(dfltvar, refspec, 'local', reload=False)
             ds.config.reload()
 
         assert isinstance(repo, GitRepo)  # just against silly code
@@ -30,7 +30,7 @@ from .http import (
 )
 from .s3 import S3Authenticator, S3Downloader
 from .shub import SHubDownloader
-from configparser import ConfigParser as SafeConfigParserWithIncludes
+from configparser import ConfigParser
 from datalad.support.external_versions import external_versions
 from datalad.support.network import RI
 from datalad.support import path
@@ -240,7 +240,10 @@ type = {credential_type}
         if files is None and cls._DEFAULT_PROVIDERS and not reload and dsroot==cls._DS_ROOT:
             return cls._DEFAULT_PROVIDERS
 
-        config = SafeConfigParserWithIncludes()
+        # default (basic) interpolation is kept on purpose: url_re values
+        # with URL-encoded characters have to be written with escaped '%%'
+        # in existing configuration files
+        config = ConfigParser()
         files_orig = files
         if files is None:
             cls._DS_ROOT = dsroot
@@ -261,9 +264,8 @@ type = {credential_type}
             if ':' in section:
                 type_, name = section.split(':', 1)
                 assert type_ in {'provider', 'credential'}, "we know only providers and credentials, got type %s" % type_
-                items = {
-                    o: config.get(section, o) for o in config.options(section)
-                }
+                # single pass over the section instead of a lookup per option
+                items = dict(config.items(section))
                 # side-effect -- items get popped
                 locals().get(type_ + "s")[name] = getattr(
                     cls, '_process_' + type_)(name, items)
@@ -245,7 +245,8 @@ class AddArchiveContent(Interface):
             delete_after=False):
 
         if exclude:
-            exclude = ensure_tuple_or_list(exclude)
+            # compile once, patterns get matched against every extracted file
+            exclude = [re.compile(e) for e in ensure_tuple_or_list(exclude)]
         if rename:
             rename = ensure_tuple_or_list(rename)
         ds = require_dataset(dataset,
@@ -502,10 +503,10 @@ class AddArchiveContent(Interface):
                 if exclude:
                     try:  # since we need to skip outside loop from inside loop
                         for regexp in exclude:
-                            if re.search(regexp, extracted_file):
+                            if regexp.search(extracted_file):
                                 lgr.debug(
-                                    "Skipping {extracted_file} since contains "
-                                    "{regexp} pattern".format(**locals()))
+                                    "Skipping %s since contains %s pattern",
+                                    extracted_file, regexp.pattern)
                                 stats.skipped += 1
                                 raise StopIteration
                     except StopIteration:
@@ -79,21 +79,23 @@ class AddReadme(Interface):
         fpath = opj(dataset.path, filename)
         res_kwargs = dict(action='add_readme', path=fpath)
 
-        if lexists(fpath) and existing == 'skip':
+        # probe once, unlocking below does not remove the file
+        fpath_exists = lexists(fpath)
+        if fpath_exists and existing == 'skip':
             yield dict(
                 res_kwargs,
                 status='notneeded',
                 message='file already exists, and not appending content')
             return
 
-        # unlock, file could be annexed
-        if lexists(fpath):
+        if fpath_exists:
+            # unlock, file could be annexed
             yield from dataset.unlock(
                 fpath,
                 return_type='generator',
                 result_renderer='disabled'
             )
-        if not lexists(fpath):
+        else:
             # if we have an annex repo, shall the README go to Git or annex?
 
             if isinstance(dataset.repo, AnnexRepo) \
@@ -129,7 +131,7 @@ class AddReadme(Interface):
                     continue
                 meta.update(dsinfo['metadata'][src])
 
-        metainfo = ''
+        metainfo = []
         for label, content in (
                 ('', meta.get('description', meta.get('shortdescription', ''))),
                 ('Author{}'.format('s' if isinstance(meta.get('author', None), list) else ''),
@@ -141,9 +143,9 @@ class AddReadme(Interface):
                 ('Funding', meta.get('fundedby', '')),
                 ):
             if label and content:
-                metainfo += u'\n\n### {}\n\n{}'.format(label, content)
+                metainfo.append(u'\n\n### {}\n\n{}'.format(label, content))
             elif content:
-                metainfo += u'\n\n{}'.format(content)
+                metainfo.append(u'\n\n{}'.format(content))
 
         for key in 'title', 'name', 'shortdescription':
             if 'title' in meta:
@@ -229,7 +231,7 @@ files, you can find out what has been done to the dataset or to individual
 files by whom, and when.
 """.format(
             title='Dataset "{}"'.format(meta['title']) if 'title' in meta else 'About this dataset',
-            metainfo=metainfo,
+            metainfo=u''.join(metainfo),
             id=u' (id: {})'.format(dataset.id) if dataset.id else '',
             )
 
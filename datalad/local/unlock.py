@@ -115,7 +115,7 @@ class Unlock(Interface):
 
         res_kwargs = dict(action='unlock', logger=lgr, refds=refds.path)
         if res_paths:
-            for p in set(res_paths).difference(set(res_paths_lexist)):
+            for p in set(res_paths).difference(res_paths_lexist):
                 yield get_status_dict(
                     status="impossible",
                     path=str(p),
@@ -180,6 +180,8 @@ class Unlock(Interface):
                 noninteractive_level=logging.INFO,
             )
             ds = Dataset(ds_path)
+            # bind once instead of querying the dataset for every record
+            ds_path = ds.path
             for r in ds.repo._call_annex_records_items_(
                     ["unlock"],
                     files=files,
@@ -191,7 +193,7 @@ class Unlock(Interface):
                     noninteractive_level=logging.DEBUG)
                 nfiles -= 1
                 yield get_status_dict(
-                    path=op.join(ds.path, r['file']),
+                    path=op.join(ds_path, r['file']),
                     status='ok' if r['success'] else 'error',
                     type='file',
                     **res_kwargs)
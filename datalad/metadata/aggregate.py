@@ -408,13 +408,13 @@ def _dump_extracted_metadata(agginto_ds, aggfrom_ds, db, to_save, force_extracti
         for objrelpath in objrelpaths.values():
             objpath = op.join(agginto_ds.path, objrelpath)
             objdir = op.dirname(objpath)
-            if not op.exists(objdir):
-                makedirs(objdir)
             if op.lexists(objpath):
                 os.unlink(objpath)  # remove previous version first
                 # was a wild thought as a workaround for 
                 # http://git-annex.branchable.com/bugs/cannot_commit___34__annex_add__34__ed_modified_file_which_switched_its_largefile_status_to_be_committed_to_git_now/#comment-bf70dd0071de1bfdae9fd4f736fd1ec1
                 # agginto_ds.repo.remove(objpath)
+            elif not op.exists(objdir):
+                makedirs(objdir)
             # XXX TODO once we have a command that can copy/move files
             # from one dataset to another including file availability
             # info, this should be used here
@@ -715,13 +715,13 @@ def _update_ds_agginfo(refds_path, ds_path, subds_paths, incremental, agginfo_db
         copy_from = op.join(agg_base_path, copy_from)
         copy_to = op.join(agg_base_path, copy_to)
         target_dir = op.dirname(copy_to)
-        if not op.exists(target_dir):
-            makedirs(target_dir)
         # TODO we could be more clever (later) and maybe `addurl` (or similar)
         # the file from another dataset
         if op.lexists(copy_to):
             # no need to unlock, just wipe out and replace
             os.remove(copy_to)
+        elif not op.exists(target_dir):
+            makedirs(target_dir)
         shutil.copy(copy_from, copy_to)
     to_save.append(
         dict(path=agginfo_fpath, type='file', staged=True))
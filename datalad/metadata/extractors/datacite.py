@@ -15,13 +15,15 @@ from collections import OrderedDict
 import logging
 lgr = logging.getLogger('datalad.metadata.extractors.datacite')
 
-try:
-    import xml.etree.cElementTree as ET
-except ImportError:
-    import xml.etree.ElementTree as ET
+# cElementTree is deprecated (removed in Python 3.9); ElementTree uses the C
+# accelerator on its own
+import xml.etree.ElementTree as ET
 
 from datalad.metadata.extractors.base import BaseMetadataExtractor
 
+# precompiled since applied to every (multi-valued) field of every record
+_WRAPPED_LINE_REGEX = re.compile(r'\n\s*')
+
 
 def _merge(iterable):
     """Merge multiple items into a single one separating with a newline"""
@@ -30,29 +32,34 @@ def _merge(iterable):
 
 def _unwrap(text):
     """Basic unwrapping of text separated by newlines"""
-    return re.sub(r'\n\s*', ' ', text)
+    return _WRAPPED_LINE_REGEX.sub(' ', text)
+
+
+# key, tag, getall, trans1, transall
+# defined once at import time instead of on every record processed
+_FIELDS = (
+    ('author', 'creatorName', True, None, None),
+    ('name', "title[@titleType='AlternativeTitle']", False, None, None),
+    # actually it seems we have no title but "ShortDescription"!!! TODO
+    #('title', "title", False, _unwrap, None),
+    ('shortdescription', "title", False, _unwrap, None),
+    ('description', 'description', True, _unwrap, _merge),
+    ('version', 'version', False, None, None),
+    ('sameas', "identifier[@identifierType='DOI']", False, None, None),
+    # conflicts with our notion for having a "type" to be internal and to demarkate a Dataset
+    # here might include the field e.g. Dataset/Neurophysiology, so skipping for now
+    # ('type', "resourceType[@resourceTypeGeneral='Dataset']", False, None, None),
+    ('citation', "relatedIdentifier", True, None, None),
+    ('tag', "subject", True, None, None),
+    ('formats', "format", True, None, None),
+)
 
 
 def _process_tree(tree, nstag):
     """Process XML tree for a record and return a dictionary for our standard
     """
     rec = OrderedDict()
-    for key, tag_, getall, trans1_, transall_ in [
-        ('author', 'creatorName', True, None, None),
-        ('name', "title[@titleType='AlternativeTitle']", False, None, None),
-        # actually it seems we have no title but "ShortDescription"!!! TODO
-        #('title', "title", False, _unwrap, None),
-        ('shortdescription', "title", False, _unwrap, None),
-        ('description', 'description', True, _unwrap, _merge),
-        ('version', 'version', False, None, None),
-        ('sameas', "identifier[@identifierType='DOI']", False, None, None),
-        # conflicts with our notion for having a "type" to be internal and to demarkate a Dataset
-        # here might include the field e.g. Dataset/Neurophysiology, so skipping for now
-        # ('type', "resourceType[@resourceTypeGeneral='Dataset']", False, None, None),
-        ('citation', "relatedIdentifier", True, None, None),
-        ('tag', "subject", True, None, None),
-        ('formats', "format", True, None, None),
-    ]:
+    for key, tag_, getall, trans1_, transall_ in _FIELDS:
         trans1 = trans1_ or (lambda x: x)
         text = lambda x: trans1(x.text.strip())
         tag = nstag(tag_)
@@ -75,26 +82,25 @@ class MetadataExtractor(BaseMetadataExtractor):
     def _get_dataset_metadata(self):
         canonical = op.join(self.ds.path, '.datalad', 'meta.datacite.xml')
 
-        # look for the first matching filename and go with it
-        fname = [canonical] if op.lexists(canonical) else \
-            [op.join(self.ds.path, f) for f in self.paths
-             if op.basename(f) == 'meta.datacite.xml']
-        if not fname or not op.lexists(fname[0]):
+        # look for the first matching filename and go with it, without
+        # scanning all remaining paths
+        fname = canonical if op.lexists(canonical) else \
+            next((op.join(self.ds.path, f) for f in self.paths
+                  if op.basename(f) == 'meta.datacite.xml'), None)
+        if not fname or not op.lexists(fname):
             return {}
-        fname = fname[0]
         # those namespaces are a b.ch
-        # TODO: avoid reading file twice
-        namespaces = dict([
-            node for _, node in ET.iterparse(
-                open(fname), events=('start-ns',)
-            )
-        ])
+        # pass the filename so the parser reads raw bytes and closes the
+        # file itself. A single pass collects the namespaces and builds the
+        # tree, which is available as .root once the iterator is exhausted
+        parser = ET.iterparse(fname, events=('start-ns',))
+        namespaces = dict([node for _, node in parser])
         ns = namespaces['']
 
         def nstag(tag):
             return './/{%s}%s' % (ns, tag)
 
-        tree = ET.ElementTree(file=fname)
+        tree = ET.ElementTree(parser.root)
         return _process_tree(tree, nstag)
 
     def _get_content_metadata(self):
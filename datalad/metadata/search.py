@@ -123,12 +123,16 @@ def _listdict2dictlist(lst, strict=True):
         if len(v)}
 
 
-def _meta2autofield_dict(meta, val2str=True, schema=None, consider_ucn=True):
+def _meta2autofield_dict(meta, val2str=True, schema=None, consider_ucn=True,
+                         indexers=None):
     """Takes care of dtype conversion into unicode, potential key mappings
     and concatenation of sequence-type fields into CSV strings
 
     - if `consider_ucn` (default) it would copy keys from
       datalad_unique_content_properties into `meta` for that extractor
+    - if `indexers` dict is provided, it is used to memoize indexers
+      resolved per metadata format name, so entry points are looked up
+      only once across calls
     - ... TODO ...
     """
     if consider_ucn:
@@ -180,6 +184,15 @@ def _meta2autofield_dict(meta, val2str=True, schema=None, consider_ucn=True):
                 yield key, v
 
     def get_indexer(metadata_format_name: str) -> callable:
+        if indexers is None:
+            return _find_indexer(metadata_format_name)
+        indexer = indexers.get(metadata_format_name)
+        if indexer is None:
+            indexer = indexers[metadata_format_name] = \
+                _find_indexer(metadata_format_name)
+        return indexer
+
+    def _find_indexer(metadata_format_name: str) -> callable:
         from pkg_resources import EntryPoint, iter_entry_points
 
         all_indexers = tuple(iter_entry_points('datalad.metadata.indexers', metadata_format_name))
@@ -316,6 +329,8 @@ class _Search(object):
     def __init__(self, ds, metadata_source=None, **kwargs):
         self.ds = ds
         self.metadata_source = metadata_source
+        # indexers resolved per metadata format, reused across records
+        self._indexers = {}
         self.documenttype = self.ds.config.obtain(
             'datalad.search.index-{}-documenttype'.format(self._mode_label),
             default=self._default_documenttype)
@@ -659,7 +674,8 @@ class _BlobSearch(_WhooshSearch):
             for k, v in _meta2autofield_dict(
                 meta,
                 val2str=True,
-                schema=None).items()))
+                schema=None,
+                indexers=self._indexers).items()))
 
     def _mk_schema(self, dsinfo):
         from whoosh import fields as wf
@@ -696,7 +712,8 @@ class _AutofieldSearch(_WhooshSearch):
     _default_documenttype = 'all'
 
     def _meta2doc(self, meta):
-        return _meta2autofield_dict(meta, val2str=True, schema=self.schema)
+        return _meta2autofield_dict(meta, val2str=True, schema=self.schema,
+                                    indexers=self._indexers)
 
     def _mk_schema(self, dsinfo):
         from whoosh import fields as wf
@@ -740,7 +757,8 @@ class _AutofieldSearch(_WhooshSearch):
             meta = res.get('metadata', {})
             # no stringification of values for speed, we do not need/use the
             # actual values at this point, only the keys
-            idxd = _meta2autofield_dict(meta, val2str=False)
+            idxd = _meta2autofield_dict(meta, val2str=False,
+                                        indexers=self._indexers)
 
             for k in idxd:
                 schema_fields[k] = wf.TEXT(stored=False,
@@ -800,7 +818,8 @@ class _EGrepCSSearch(_Search):
             # dataset will be reported again
             meta = res.get('metadata', {})
             # produce a flattened metadata dict to search through
-            doc = _meta2autofield_dict(meta, val2str=True, consider_ucn=consider_ucn)
+            doc = _meta2autofield_dict(meta, val2str=True, consider_ucn=consider_ucn,
+                                       indexers=self._indexers)
             # inject a few basic properties into the dict
             # analog to what the other modes do in their index
             doc.update({
@@ -934,7 +953,8 @@ class _EGrepCSSearch(_Search):
                 if k == 'parentds' or k in res})
 
             # no stringification of values for speed
-            idxd = _meta2autofield_dict(meta, val2str=False)
+            idxd = _meta2autofield_dict(meta, val2str=False,
+                                        indexers=self._indexers)
 
             for k, kvals in idxd.items():
                 # TODO deal with conflicting definitions when available
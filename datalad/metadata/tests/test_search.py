@@ -421,6 +421,36 @@ def test_external_indexer():
     )
 
 
+def test_external_indexer_memoized():
+    """ check that indexers are looked up only once if a cache is given """
+    class MockedIndexer(MetadataIndexer):
+        def __init__(self, metadata_format_name: str):
+            super().__init__(metadata_format_name)
+
+        def create_index(self, metadata):
+            yield from metadata.items()
+
+    class MockedEntryPoint(EntryPoint):
+        def __init__(self):
+            pass
+
+        def load(self, *args):
+            return MockedIndexer
+
+    def _mocked_iter_entry_points(group, metadata):
+        yield MockedEntryPoint()
+
+    indexers = {}
+    mocked = MagicMock(side_effect=_mocked_iter_entry_points)
+    with patch('pkg_resources.iter_entry_points', mocked):
+        for i in range(3):
+            eq_(_meta2autofield_dict({'extr1': {'prop1': i}},
+                                     indexers=indexers),
+                {'extr1.prop1': str(i)})
+    eq_(mocked.call_count, 1)
+    assert_in('extr1', indexers)
+
+
 def test_faulty_external_indexer():
     """ check that generic indexer is called on external indexer faults """
     class MockedEntryPoint(EntryPoint):
@@ -323,7 +323,7 @@ class ExtractedArchive(object):
         # we need to extract the archive
         # TODO: extract to _tmp and then move in a single command so we
         # don't end up picking up broken pieces
-        lgr.debug(u"Extracting {self._archive} under {path}".format(**locals()))
+        lgr.debug("Extracting %s under %s", self._archive, path)
         if exists(path):
             lgr.debug(
                 "Previous extracted (but probably not fully) cached archive "
@@ -416,7 +416,7 @@ class ExtractedArchive(object):
         return leading if leading is None else opj(*leading)
 
     def get_extracted_file(self, afile):
-        lgr.debug(u"Requested file {afile} from archive {self._archive}".format(**locals()))
+        lgr.debug("Requested file %s from archive %s", afile, self._archive)
         # TODO: That could be a good place to provide "compatibility" layer if
         # filenames within archive are too obscure for local file system.
         # We could somehow adjust them while extracting and here channel back
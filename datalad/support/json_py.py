@@ -66,10 +66,11 @@ def dump(obj, fname, compressed=False):
     _open = LZMAFile if compressed else io.open
 
     indir = dirname(fname)
-    if not exists(indir):
-        makedirs(indir)
+    # an existing file implies an existing directory, no need to probe both
     if lexists(fname):
         os.unlink(fname)
+    elif not exists(indir):
+        makedirs(indir)
     with _open(fname, 'wb') as f:
         return dump2fileobj(
             obj,